@@ -183,7 +183,7 @@ def _list_devices(devices, using_filters=False, device_id=None, verbose=False, d
 def _print_dev_status(dev, status):
     if not status:
         return
-    print(f'{dev.description}')
+    print(dev.description)
     tmp = []
     kcols, vcols = 0, 0
     for k, v, u in status:
@@ -204,8 +204,8 @@ def _print_dev_status(dev, status):
 
 
 def _device_set_color(dev, args, **opts):
-    color = map(color_from_str, args['<color>'])
-    dev.set_color(args['<channel>'], args['<mode>'], color, **opts)
+    colors = [color_from_str(x) for x in args['<color>']]
+    dev.set_color(args['<channel>'], args['<mode>'], colors, **opts)
 
 
 def _device_set_speed(dev, args, **opts):
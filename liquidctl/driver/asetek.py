@@ -108,10 +108,10 @@ class _CommonAsetekDriver(UsbDriver):
         self.device.release()
         return msg
 
-    def _configure_device(self, color1=[0, 0, 0], color2=[0, 0, 0], color3=[255, 0, 0],
+    def _configure_device(self, color1=(0, 0, 0), color2=(0, 0, 0), color3=(255, 0, 0),
                           alert_temp=_HIGH_TEMPERATURE, interval1=0, interval2=0,
                           blackout=False, fading=False, blinking=False, enable_alert=True):
-        self._write([0x10] + color1 + color2 + color3
+        self._write([0x10] + list(color1) + list(color2) + list(color3)
                     + [alert_temp, interval1, interval2, not blackout, fading,
                        blinking, enable_alert, 0x00, 0x01])
 
@@ -225,7 +225,7 @@ class Modern690Lc(_CommonAsetekDriver):
         ]
 
     def set_color(self, channel, mode, colors, time_per_color=1, time_off=None,
-                  alert_threshold=_HIGH_TEMPERATURE, alert_color=[255, 0, 0],
+                  alert_threshold=_HIGH_TEMPERATURE, alert_color=(255, 0, 0),
                   speed=3, **kwargs):
         """Set the color mode for a specific channel."""
         # keyword arguments may have been forwarded from cli args and need parsing
@@ -352,7 +352,7 @@ class Legacy690Lc(_CommonAsetekDriver):
         ]
 
     def set_color(self, channel, mode, colors, time_per_color=None, time_off=None,
-                  alert_threshold=_HIGH_TEMPERATURE, alert_color=[255, 0, 0],
+                  alert_threshold=_HIGH_TEMPERATURE, alert_color=(255, 0, 0),
                   **kwargs):
         """Set the color mode for a specific channel."""
         # keyword arguments may have been forwarded from cli args and need parsing
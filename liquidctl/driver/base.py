@@ -151,5 +151,11 @@ def find_all_subclasses(cls):
 
     Returns a set of subclasses of `cls`.
     """
-    sub = set(cls.__subclasses__())
-    return sub.union([s for c in cls.__subclasses__() for s in find_all_subclasses(c)])
+    found = set()
+    pending = [cls]
+    while pending:
+        for sub in pending.pop().__subclasses__():
+            if sub not in found:
+                found.add(sub)
+                pending.append(sub)
+    return found
@@ -48,6 +48,11 @@ _PROFILE_LENGTH_OFFSET = 0x1D - 3
 _PROFILE_LENGTH = 7
 _CRITICAL_TEMPERATURE = 60
 
+# These hex strings are currently magic values that work but Im not quite sure why.
+_ENABLE_LEDS_DATA1 = bytes.fromhex("0101ffffffffffffffffffffffffff7f7f7f7fff00ffffffff00ffffffff00ffffffff00ffffffff00ffffffff00ffffffffffffffffffffffffffffff")
+_ENABLE_LEDS_DATA2 = bytes.fromhex("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f2021222324252627ffffffffffffffffffffffffffffffffffffffffff")
+_ENABLE_LEDS_DATA3 = bytes.fromhex("28292a2b2c2d2e2f303132333435363738393a3b3c3d3e3f404142434445464748494a4b4c4d4e4fffffffffffffffffffffffffffffffffffffffffff")
+
 
 @unique
 class _FanMode(Enum):
@@ -274,15 +279,10 @@ class HydroPlatinum(UsbHidDriver):
         
 
         if self._data.load('leds_enabled', of_type=int, default=0) == 0:
-            # These hex strings are currently magic values that work but Im not quite sure why.
-            d1 = bytes.fromhex("0101ffffffffffffffffffffffffff7f7f7f7fff00ffffffff00ffffffff00ffffffff00ffffffff00ffffffff00ffffffffffffffffffffffffffffff")
-            d2 = bytes.fromhex("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f2021222324252627ffffffffffffffffffffffffffffffffffffffffff")
-            d3 = bytes.fromhex("28292a2b2c2d2e2f303132333435363738393a3b3c3d3e3f404142434445464748494a4b4c4d4e4fffffffffffffffffffffffffffffffffffffffffff")
-
-            # Send the magic messages to enable setting the LEDs to statuC values
-            self._send_command(None, 0b001, data=d1)
-            self._send_command(None, 0b010, data=d2)
-            self._send_command(None, 0b011, data=d3)
+            # Send the magic messages to enable setting the LEDs to static values
+            self._send_command(None, 0b001, data=_ENABLE_LEDS_DATA1)
+            self._send_command(None, 0b010, data=_ENABLE_LEDS_DATA2)
+            self._send_command(None, 0b011, data=_ENABLE_LEDS_DATA3)
             self._data.store('leds_enabled', 1)
 
         data1 = bytes(itertools.chain(*((b, g, r) for r, g, b in expanded[0:20])))
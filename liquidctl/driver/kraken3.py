@@ -114,6 +114,16 @@ _STATIC_VALUE = {
     0b111: 40,  # may result in long all-off intervals (FIXME?)
 }
 
+# Mode specific value in the footer of the animation message; not yet understood
+_MODE_RELATED_VALUE = {
+    'fading': 0x08,
+    'pulse': 0x08,
+    'breathing': 0x08,
+    'tai-chi': 0x05,
+    'water-cooler': 0x05,
+    'loading': 0x04,
+}
+
 # Speed scale/timing bytes
 # scale -> (slowest, slow, normal, fast, fastest)
 _SPEED_VALUE = {
@@ -313,17 +323,9 @@ class KrakenX3(UsbHidDriver):
                 backwards_byte = 0x00
             if 'backwards' in mode:
                 backwards_byte += 0x02
-            if mode == 'fading' or mode == 'pulse' or mode == 'breathing':
-                mode_related = 0x08
-            elif mode == 'tai-chi':
-                mode_related = 0x05
-            elif mode == 'water-cooler':
-                mode_related = 0x05
+            mode_related = _MODE_RELATED_VALUE.get(mode, 0x00)
+            if mode == 'water-cooler':
                 color_count = 0x01
-            elif mode == 'loading':
-                mode_related = 0x04
-            else:
-                mode_related = 0x00
             static_byte = _STATIC_VALUE[cid]
             led_size = size_variant if mval == 0x03 or mval == 0x05 else 0x03
             footer = [backwards_byte, color_count, mode_related, static_byte, led_size]
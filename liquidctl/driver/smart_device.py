@@ -119,6 +119,11 @@ _ANIMATION_SPEEDS = {
 _MIN_DUTY = 0
 _MAX_DUTY = 100
 
+# Smart Device (V1) status lookups: fan control modes (indexed by state) and
+# (name, LED count) of the LED accessory type
+_FAN_CONTROL_MODES = ('—', 'DC', 'PWM')
+_LED_ACCESSORY_TYPES = (('HUE+ Strip', 10), ('Aer RGB', 8))
+
 class _CommonSmartDeviceDriver(UsbHidDriver):
     """Common functions of Smart Device and Grid drivers."""
 
@@ -257,7 +262,7 @@ class SmartDevice(_CommonSmartDeviceDriver):
             msg = self.device.read(self._READ_LENGTH)
             num = (msg[15] >> 4) + 1
             state = msg[15] & 0x3
-            status.append(('Fan {}'.format(num), ['—', 'DC', 'PWM'][state], ''))
+            status.append(('Fan {}'.format(num), _FAN_CONTROL_MODES[state], ''))
             noise.append(msg[1])
             if state:
                 status.append(('Fan {} speed'.format(num), msg[3] << 8 | msg[4], 'rpm'))
@@ -271,7 +276,7 @@ class SmartDevice(_CommonSmartDeviceDriver):
                 lcount = msg[0x11]
                 status.append(('LED accessories', lcount, ''))
                 if lcount > 0:
-                    ltype, lsize = [('HUE+ Strip', 10), ('Aer RGB', 8)][msg[0x10] >> 3]
+                    ltype, lsize = _LED_ACCESSORY_TYPES[msg[0x10] >> 3]
                     status.append(('LED accessory type', ltype, ''))
                     status.append(('LED count (total)', lcount*lsize, ''))
         status.append(('Noise level', round(sum(noise)/len(noise)), 'dB'))
@@ -89,10 +89,11 @@ class BaseUsbDriver(BaseDriver):
     def probe(cls, handle, vendor=None, product=None, release=None,
               serial=None, match=None, **kwargs):
         """Probe `handle` and yield corresponding driver instances."""
+        handle_ids = (handle.vendor_id, handle.product_id)
         for vid, pid, _, description, devargs in cls.SUPPORTED_DEVICES:
-            if (vendor and vendor != vid) or handle.vendor_id != vid:
+            if (vid, pid) != handle_ids:
                 continue
-            if (product and product != pid) or handle.product_id != pid:
+            if (vendor and vendor != vid) or (product and product != pid):
                 continue
             if release and handle.release_number != release:
                 continue
@@ -173,8 +174,9 @@ class UsbHidDriver(BaseUsbDriver):
     def find_supported_devices(cls, **kwargs):
         """Find devices specifically compatible with this driver."""
         devs = []
+        hidapi_bus = HidapiBus()
         for vid, pid, _, _, _ in cls.SUPPORTED_DEVICES:
-            for dev in HidapiBus().find_devices(vendor=vid, product=pid, **kwargs):
+            for dev in hidapi_bus.find_devices(vendor=vid, product=pid, **kwargs):
                 if type(dev) == cls:
                     devs.append(dev)
         return devs
@@ -204,8 +206,9 @@ class UsbDriver(BaseUsbDriver):
     def find_supported_devices(cls, **kwargs):
         """Find devices specifically compatible with this driver."""
         devs = []
+        pyusb_bus = PyUsbBus()
         for vid, pid, _, _, _ in cls.SUPPORTED_DEVICES:
-            for dev in PyUsbBus().find_devices(vendor=vid, product=pid, **kwargs):
+            for dev in pyusb_bus.find_devices(vendor=vid, product=pid, **kwargs):
                 if type(dev) == cls:
                     devs.append(dev)
         return devs
@@ -357,6 +360,7 @@ class HidapiDevice:
         self.api = hidapi
         self.hidinfo = hidapi_dev_info
         self.hiddev = self.api.device()
+        self._address = None
 
     def open(self):
         """Connect to the device."""
@@ -483,7 +487,11 @@ class HidapiDevice:
 
     @property
     def address(self):
-        return self.hidinfo['path'].decode(errors='replace')
+        if self._address is None:
+            # the path is immutable; decode it once, as bus filtering and
+            # __eq__ can hit this repeatedly
+            self._address = self.hidinfo['path'].decode(errors='replace')
+        return self._address
 
     @property
     def port(self):
@@ -499,7 +507,7 @@ class HidapiBus(BaseBus):
         handles = HidapiDevice.enumerate(hid, vendor, product)
         drivers = sorted(find_all_subclasses(UsbHidDriver), key=lambda x: x.__name__)
         LOGGER.debug('searching %s (api=%s, drivers=[%s])', self.__class__.__name__, hid.__name__,
-                     ', '.join(map(lambda x: x.__name__, drivers)))
+                     ', '.join(drv.__name__ for drv in drivers))
         for handle in handles:
             if bus and handle.bus != bus:
                 continue
@@ -517,7 +525,7 @@ class PyUsbBus(BaseBus):
         """ Find compatible regular USB devices."""
         drivers = sorted(find_all_subclasses(UsbDriver), key=lambda x: x.__name__)
         LOGGER.debug('searching %s (drivers=[%s])', self.__class__.__name__,
-                     ', '.join(map(lambda x: x.__name__, drivers)))
+                     ', '.join(drv.__name__ for drv in drivers))
         for handle in PyUsbDevice.enumerate(vendor, product):
             if bus and handle.bus != bus:
                 continue
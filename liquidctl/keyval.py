@@ -50,7 +50,7 @@ class _FilesystemBackend:
         return key
 
     def __init__(self, key_prefixes):
-        key_prefixes = map(self._sanitize, key_prefixes)
+        key_prefixes = [self._sanitize(p) for p in key_prefixes]
         # compute read and write dirs from base runtime dirs: the first base
         # dir is selected for writes and prefered for reads
         self._read_dirs = [os.path.join(x, *key_prefixes) for x in get_runtime_dirs()]
@@ -64,18 +64,19 @@ class _FilesystemBackend:
     def load(self, key):
         for base in self._read_dirs:
             path = os.path.join(base, key)
-            if not os.path.isfile(path):
-                continue
             try:
-                with open(path, mode='r') as f:
-                    data = f.read().strip()
+                with open(path, mode='rb', buffering=0) as f:
+                    data = f.read().decode().strip()
                     if len(data) == 0:
                         value = None
                     else:
                         value = literal_eval(data)
                     LOGGER.debug('loaded %s=%r (from %s)', key, value, path)
             except OSError as err:
-                LOGGER.warning('%s exists but cannot be read: %s', path, err)
+                # tell an unreadable file apart from a missing one or from a
+                # base dir that cannot be entered
+                if os.path.isfile(path):
+                    LOGGER.warning('%s exists but cannot be read: %s', path, err)
                 continue
             return value
         LOGGER.debug('no data (file) found for %s', key)
@@ -85,10 +86,9 @@ class _FilesystemBackend:
         data = repr(value)
         assert literal_eval(data) == value, 'encode/decode roundtrip fails'
         path = os.path.join(self._write_dir, key)
-        fd, tmp = tempfile.mkstemp(dir=self._write_dir, text=True)
-        with open(fd, mode='w') as f:
-            f.write(data)
-            f.flush()
+        fd, tmp = tempfile.mkstemp(dir=self._write_dir)
+        with open(fd, mode='wb') as f:
+            f.write(data.encode())
         os.replace(tmp, path)
         LOGGER.debug('stored %s=%r (in %s)', key, value, path)
 
@@ -84,6 +84,8 @@ class LazyHexRepr:
     >>> '%r' % LazyHexRepr(b'abc', end=-1)
     '61:62'
     """
+    __slots__ = ('data', 'start', 'end', 'sep')
+
     def __init__(self, data, start=None, end=None, sep=':'):
         self.data = data
         self.start = start
@@ -198,6 +200,8 @@ def interpolate_profile(profile, x):
     70
     >>> interpolate_profile([(20, 50)], 20)
     50
+    >>> interpolate_profile([(20, 50), (50, 70), (60, 100)], 50)
+    70
     """
     lower, upper = profile[0], profile[-1]
     for step in profile:
@@ -71,6 +71,14 @@ class Modern690LcTestCase(unittest.TestCase):
         assert wIndex == 0
         assert datalen == None
 
+    def test_accepts_color_tuples(self):
+        self.mock_usb._reset_sent()
+
+        self.device.set_color(channel='led', mode='fixed', colors=[(3, 2, 1)])
+
+        _begin, (_, _, color_data), _ = self.mock_usb._sent_xfers
+        assert color_data[0:10] == [0x10, 3, 2, 1, 0, 0, 0, 255, 0, 0]
+
 
 class Legacy690LcTestCase(unittest.TestCase):
     def setUp(self):
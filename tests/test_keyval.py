@@ -0,0 +1,51 @@
+import logging
+import os
+import pytest
+from pytest import fixture
+from liquidctl import keyval
+from liquidctl.keyval import RuntimeStorage
+
+
+@fixture
+def runtime_dirs(tmp_path, monkeypatch):
+    dirs = [str(tmp_path / 'preferred'), str(tmp_path / 'fallback')]
+    monkeypatch.setattr(keyval, 'get_runtime_dirs', lambda: dirs)
+    return dirs
+
+
+def test_loads_stored_value(runtime_dirs):
+    RuntimeStorage(['prefix', 'other']).store('key', 42)
+    assert RuntimeStorage(['prefix', 'other']).load('key') == 42
+
+
+def test_loads_from_fallback_dir_with_key_prefixes(runtime_dirs):
+    fallback = os.path.join(runtime_dirs[1], 'prefix', 'other')
+    os.makedirs(fallback)
+    with open(os.path.join(fallback, 'key'), 'w') as f:
+        f.write('42')
+    assert RuntimeStorage(['prefix', 'other']).load('key') == 42
+
+
+def test_missing_key_returns_default(runtime_dirs):
+    assert RuntimeStorage(['prefix']).load('key', default=-1) == -1
+
+
+@pytest.mark.skipif(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                    reason='permissions are not enforced for root')
+def test_unreadable_fallback_dir_is_skipped_silently(runtime_dirs, caplog):
+    fallback = os.path.join(runtime_dirs[1], 'prefix')
+    os.makedirs(fallback)
+    os.chmod(fallback, 0)
+    try:
+        assert RuntimeStorage(['prefix']).load('key', default=-1) == -1
+    finally:
+        os.chmod(fallback, 0o1700)
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+
+def test_fallback_path_through_file_is_skipped_silently(runtime_dirs, caplog):
+    os.makedirs(runtime_dirs[1])
+    with open(os.path.join(runtime_dirs[1], 'prefix'), 'w') as f:
+        f.write('not a dir')
+    assert RuntimeStorage(['prefix']).load('key', default=-1) == -1
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
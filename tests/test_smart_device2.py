@@ -12,6 +12,7 @@ class _MockSmartDevice2(MockHidapiDevice):
         self.raw_led_channels = raw_led_channels
 
     def write(self, data):
+        super().write(data)
         reply = bytearray(64)
         if data[0:2] == [0x10, 0x01]:
             reply[0:2] = [0x11, 0x01]
@@ -43,3 +44,16 @@ class SmartDevice2TestCase(unittest.TestCase):
         self.device.set_color(channel='led1', mode='breathing', colors=iter([[142, 24, 68]]),
                               speed='fastest')
         self.device.set_fixed_speed(channel='fan3', duty=50)
+
+    def test_sync_fixed_speed_sends_one_message_per_fan(self):
+        self.device.set_fixed_speed(channel='sync', duty=50)
+        self.assertEqual([r.number for r in self.mock_hid.sent], [0x62] * 3)
+        self.assertEqual([r.data[:5] for r in self.mock_hid.sent],
+                         [[0x01, 0b001, 50, 0, 0],
+                          [0x01, 0b010, 0, 50, 0],
+                          [0x01, 0b100, 0, 0, 50]])
+
+    def test_single_channel_fixed_speed(self):
+        self.device.set_fixed_speed(channel='fan2', duty=42)
+        self.assertEqual(self.mock_hid.sent[0].number, 0x62)
+        self.assertEqual(self.mock_hid.sent[0].data[:5], [0x01, 0b010, 0, 42, 0])